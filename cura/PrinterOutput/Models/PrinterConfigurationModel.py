@@ -2,7 +2,7 @@
 # Cura is released under the terms of the LGPLv3 or higher.
 
 from PyQt6.QtCore import pyqtProperty, QObject, pyqtSignal
-from typing import List
+from typing import List, Optional
 
 MYPY = False
 if MYPY:
@@ -18,9 +18,22 @@ class PrinterConfigurationModel(QObject):
         self._printer_type = ""
         self._extruder_configurations = []     # type: List[ExtruderConfigurationModel]
         self._buildplate_configuration = ""
+        self._cached_hash = None  # type: Optional[int]
+        self._sorted_extruders = None  # type: Optional[List[ExtruderConfigurationModel]]
+        self.configurationChanged.connect(self._invalidateCaches)
+
+    def _invalidateCaches(self) -> None:
+        self._cached_hash = None
+        self._sorted_extruders = None
+
+    def _getSortedExtruderConfigurations(self) -> List["ExtruderConfigurationModel"]:
+        if self._sorted_extruders is None:
+            self._sorted_extruders = sorted(self._extruder_configurations, key = lambda x: x.position)
+        return self._sorted_extruders
 
     def setPrinterType(self, printer_type: str) -> None:
         self._printer_type = printer_type
+        self._invalidateCaches()  # setPrinterType doesn't emit configurationChanged, so invalidate here.
 
     @pyqtProperty(str, fset = setPrinterType, notify = configurationChanged)
     def printerType(self) -> str:
@@ -28,6 +41,14 @@ class PrinterConfigurationModel(QObject):
 
     def setExtruderConfigurations(self, extruder_configurations: List["ExtruderConfigurationModel"]) -> None:
         if self._extruder_configurations != extruder_configurations:
+            # Disconnect the replaced extruders first, otherwise their connections pile up and every change
+            # re-emits configurationChanged once per stale connection.
+            for extruder_configuration in self._extruder_configurations:
+                try:
+                    extruder_configuration.extruderConfigurationChanged.disconnect(self.configurationChanged)
+                except TypeError:  # Signal was not connected.
+                    pass
+
             self._extruder_configurations = extruder_configurations
 
             for extruder_configuration in self._extruder_configurations:
@@ -53,34 +74,27 @@ class PrinterConfigurationModel(QObject):
 
         The method checks if the mandatory fields are or not set
         """
-        if not self._extruder_configurations:
-            return False
-        for configuration in self._extruder_configurations:
-            if configuration is None:
-                return False
-        return self._printer_type != ""
+        return bool(self._extruder_configurations) and self._printer_type != "" and all(
+            configuration is not None for configuration in self._extruder_configurations)
 
     def hasAnyMaterialLoaded(self) -> bool:
         if not self.isValid():
             return False
         for configuration in self._extruder_configurations:
-            if configuration.activeMaterial and configuration.activeMaterial.type != "empty":
+            material = configuration.activeMaterial
+            if material is not None and material.type != "empty":
                 return True
         return False
 
     def __str__(self):
-        message_chunks = []
-        message_chunks.append("Printer type: " + self._printer_type)
-        message_chunks.append("Extruders: [")
-        for configuration in self._extruder_configurations:
-            message_chunks.append("   " + str(configuration))
-        message_chunks.append("]")
-        if self._buildplate_configuration is not None:
-            message_chunks.append("Buildplate: " + self._buildplate_configuration)
-
-        return "\n".join(message_chunks)
+        extruders = "".join(f"\n   {configuration}" for configuration in self._extruder_configurations)
+        buildplate = f"\nBuildplate: {self._buildplate_configuration}" if self._buildplate_configuration is not None else ""
+        return f"Printer type: {self._printer_type}\nExtruders: [{extruders}\n]{buildplate}"
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if not isinstance(other, PrinterConfigurationModel):
             return False
 
@@ -93,7 +107,15 @@ class PrinterConfigurationModel(QObject):
         if len(self.extruderConfigurations) != len(other.extruderConfigurations):
             return False
 
-        for self_extruder, other_extruder in zip(sorted(self._extruder_configurations, key=lambda x: x.position), sorted(other.extruderConfigurations, key=lambda x: x.position)):
+        # Only sort when there is more than one extruder; sorting a single-element list is wasted work.
+        if len(self._extruder_configurations) > 1:
+            self_extruders = self._getSortedExtruderConfigurations()
+            other_extruders = other._getSortedExtruderConfigurations()
+        else:
+            self_extruders = self._extruder_configurations
+            other_extruders = other.extruderConfigurations
+
+        for self_extruder, other_extruder in zip(self_extruders, other_extruders):
             if self_extruder != other_extruder:
                 return False
 
@@ -104,14 +126,8 @@ class PrinterConfigurationModel(QObject):
 
         of the extruders is unique (the order of the extruders matters), and the type and buildplate is the same.
         """
-        extruder_hash = hash(0)
-        first_extruder = None
-        for configuration in self._extruder_configurations:
-            extruder_hash ^= hash(configuration)
-            if configuration.position == 0:
-                first_extruder = configuration
-        # To ensure the correct order of the extruders, we add an "and" operation using the first extruder hash value
-        if first_extruder:
-            extruder_hash &= hash(first_extruder)
-
-        return hash(self._printer_type) ^ extruder_hash ^ hash(self._buildplate_configuration)
+        if self._cached_hash is None:
+            # Sort the extruders by position so the hash matches the equality semantics of __eq__.
+            self._cached_hash = hash((self._printer_type, self._buildplate_configuration,
+                                      tuple(hash(configuration) for configuration in self._getSortedExtruderConfigurations())))
+        return self._cached_hash
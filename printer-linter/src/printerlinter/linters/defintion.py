@@ -1,22 +1,116 @@
-import json
-import re
+from functools import cached_property
 from pathlib import Path
-from typing import Iterator
+from typing import ClassVar, Dict, Iterator, Optional, Tuple
+
+import orjson
 
 from ..diagnostic import Diagnostic
 from .linter import Linter
 from ..replacement import Replacement
 
+try:
+    # Optional acceleration for bulk numeric comparisons; the pure-Python fallback behaves identically.
+    import numpy
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit("boolean[:](float64[:], float64[:])", cache = True)
+    def _compareFloatArraysKernel(child_values, check_values):
+        result = numpy.empty(child_values.shape[0], dtype = numpy.bool_)
+        for index in range(child_values.shape[0]):
+            result[index] = child_values[index] == check_values[index]
+        return result
+
+    def _compareFloatArrays(child_values, check_values):
+        """ Compares the paired float lists element-wise, returning a boolean sequence of equal pairs. """
+        return _compareFloatArraysKernel(numpy.asarray(child_values, dtype = numpy.float64),
+                                         numpy.asarray(check_values, dtype = numpy.float64))
+else:
+    def _compareFloatArrays(child_values, check_values):
+        """ Compares the paired float lists element-wise, returning a boolean sequence of equal pairs. """
+        return [child_value == check_value for child_value, check_value in zip(child_values, check_values)]
+
+
+def _isFloat(value) -> bool:
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def _findOverrideSpan(content: str, key: str) -> Optional[Tuple[int, int, int]]:
+    """ Finds the '"key": { ... }' override block in content with a plain substring search and a brace-balance scan.
+
+    Returns the start of the line containing the key, the offset of the key itself and the end of the block (one past
+    the closing brace, or past the trailing comma when present), or None when the key has no override block in content.
+    """
+    key_offset = content.find(f'"{key}"')
+    if key_offset == -1:
+        return None
+    block_start = content.find("{", key_offset)
+    if block_start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    index = block_start
+    content_length = len(content)
+    while index < content_length:
+        character = content[index]
+        if in_string:
+            if character == "\\":
+                index += 1
+            elif character == '"':
+                in_string = False
+        elif character == '"':
+            in_string = True
+        elif character == "{":
+            depth += 1
+        elif character == "}":
+            depth -= 1
+            if depth == 0:
+                index += 1
+                break
+        index += 1
+    if index < content_length and content[index] == ",":
+        index += 1
+
+    line_start = content.rfind("\n", 0, key_offset) + 1
+    return line_start, key_offset, index
+
+
+def _normalizeNumber(value):
+    """ Normalizes a numeric setting value to its canonical string form, so 10, 10.0 and "10.0" compare equal. """
+    try:
+        return str(float(value))
+    except (TypeError, ValueError):
+        return value
+
 
 class Definition(Linter):
     """ Finds issues in definition files, such as overriding default parameters """
+
+    # Parsed definition files, shared between all Definition instances. Inherited parents such as fdmprinter are at
+    # the root of nearly every chain, so parsing them once saves re-reading them for every linted file.
+    _PARSE_CACHE: ClassVar[Dict[Path, dict]] = {}
+
     def __init__(self, file: Path, settings: dict) -> None:
         super().__init__(file, settings)
         self._definitions = {}
+        self._override_chain_cache = {}
+        self._parent_normalized = {}
+        self._primary_name = file.name.split(".", 1)[0]
         self._loadDefinitionFiles(file)
-        self._content = self._file.read_text()
         self._loadBasePrinterSettings()
 
+    @cached_property
+    def _content(self) -> str:
+        """ The raw text of the linted file, only read when a check actually needs it. """
+        return self._file.read_text()
+
     @property
     def base_def(self):
         if "fdmextruder" in self._definitions:
@@ -33,90 +127,145 @@ class Definition(Linter):
         # TODO: A check if the key exist in the first place
         # TODO: Check if the model platform exist
 
-        yield
-
     def checkRedefineOverride(self) -> Iterator[Diagnostic]:
         """ Checks if definition file overrides its parents settings with the same value. """
-        definition_name = list(self._definitions.keys())[0]
+        definition_name = self._primary_name
         definition = self._definitions[definition_name]
-        if "overrides" in definition and definition_name not in ("fdmprinter", "fdmextruder"):
-            for key, value_dict in definition["overrides"].items():
-                is_redefined, child_key, child_value, parent = self._isDefinedInParent(key, value_dict, definition['inherits'])
-                if is_redefined:
-                    redefined = re.compile(r'.*(\"' + key + r'\"[\s\:\S]*?)\{[\s\S]*?\},?')
-                    found = redefined.search(self._content)
-                    # TODO: Figure out a way to support multiline fixes in the PR review GH Action, for now suggest no fix to ensure no ill-formed json are created
-                    #  see: https://github.com/platisd/clang-tidy-pr-comments/issues/37
-                    if len(found.group().splitlines()) > 1:
-                        replacements = []
-                    else:
-                        replacements = [Replacement(
-                            file = self._file,
-                            offset = found.span(1)[0],
-                            length = len(found.group()),
-                            replacement_text = "")]
-
-                    yield Diagnostic(
-                        file = self._file,
-                        diagnostic_name = "diagnostic-definition-redundant-override",
-                        message = f"Overriding {key} with the same value ({child_key}: {child_value}) as defined in parent definition: {definition['inherits']}",
-                        level = "Warning",
-                        offset = found.span(0)[0],
-                        replacements = replacements
-                    )
+        if "overrides" not in definition or definition_name in ("fdmprinter", "fdmextruder"):
+            return
+
+        # Resolve every override against the parent first. Comparisons where both sides are numbers are batched and
+        # compared in a single kernel call; each key reports its first matching comparison, as before.
+        matches = {}  # key -> (sequence, child_key, child_value)
+        numeric_meta = []  # (key, sequence, child_key, child_value)
+        numeric_child_values = []
+        numeric_check_values = []
+        for key, value_dict in definition["overrides"].items():
+            for sequence, comparison in enumerate(self._collectParentComparisons(key, value_dict, definition["inherits"])):
+                child_key, child_value, normalized_value, check_value, is_float_pair = comparison
+                if is_float_pair:
+                    numeric_meta.append((key, sequence, child_key, child_value))
+                    numeric_child_values.append(float(normalized_value))
+                    numeric_check_values.append(float(check_value))
+                elif normalized_value == check_value:
+                    matches[key] = (sequence, child_key, child_value)
+                    break
+
+        if numeric_child_values:
+            for (key, sequence, child_key, child_value), is_equal in zip(numeric_meta, _compareFloatArrays(numeric_child_values, numeric_check_values)):
+                if is_equal and (key not in matches or sequence < matches[key][0]):
+                    matches[key] = (sequence, child_key, child_value)
+
+        for key in definition["overrides"]:
+            if key not in matches:
+                continue
+            _, child_key, child_value = matches[key]
+            span = _findOverrideSpan(self._content, key)
+            if span is None:
+                continue
+            line_start, key_offset, block_end = span
+            # TODO: Figure out a way to support multiline fixes in the PR review GH Action, for now suggest no fix to ensure no ill-formed json are created
+            #  see: https://github.com/platisd/clang-tidy-pr-comments/issues/37
+            if "\n" in self._content[line_start:block_end]:
+                replacements = []
+            else:
+                replacements = [Replacement(
+                    file = self._file,
+                    offset = key_offset,
+                    length = block_end - line_start,
+                    replacement_text = "")]
+
+            yield Diagnostic(
+                file = self._file,
+                diagnostic_name = "diagnostic-definition-redundant-override",
+                message = f"Overriding {key} with the same value ({child_key}: {child_value}) as defined in parent definition: {definition['inherits']}",
+                level = "Warning",
+                offset = line_start,
+                replacements = replacements
+            )
 
     def _loadDefinitionFiles(self, definition_file) -> None:
-        """ Loads definition file contents into self._definitions. Also load parent definition if it exists. """
-        definition_name = Path(definition_file.stem).stem
+        """ Loads definition file contents into self._definitions, following the inherits chain until it reaches a
+        root definition or one that is already loaded. """
+        while True:
+            definition_name = definition_file.name.split(".", 1)[0]
 
-        if not definition_file.exists() or definition_name in self._definitions:
-            return
+            if not definition_file.exists() or definition_name in self._definitions:
+                return
 
-        # Load definition file into dictionary
-        self._definitions[definition_name] = json.loads(definition_file.read_text())
+            # Load definition file into dictionary, through the shared parse cache
+            resolved_file = definition_file.resolve()
+            parsed = Definition._PARSE_CACHE.get(resolved_file)
+            if parsed is None:
+                parsed = orjson.loads(definition_file.read_bytes())
+                Definition._PARSE_CACHE[resolved_file] = parsed
+            self._definitions[definition_name] = parsed
 
-        # Load parent definition if it exists
-        if "inherits" in self._definitions[definition_name]:
-            if self._definitions[definition_name]['inherits'] in ("fdmextruder", "fdmprinter"):
-                parent_file = definition_file.parent.parent.joinpath("definitions", f"{self._definitions[definition_name]['inherits']}.def.json")
+            # Continue with the parent definition if it exists
+            if "inherits" not in parsed:
+                return
+            if parsed["inherits"] in ("fdmextruder", "fdmprinter"):
+                definition_file = definition_file.parent.parent.joinpath("definitions", f"{parsed['inherits']}.def.json")
             else:
-                parent_file = definition_file.parent.joinpath(f"{self._definitions[definition_name]['inherits']}.def.json")
-            self._loadDefinitionFiles(parent_file)
-
-    def _isDefinedInParent(self, key, value_dict, inherits_from):
-        if "overrides" not in self._definitions[inherits_from]:
-            return self._isDefinedInParent(key, value_dict, self._definitions[inherits_from]["inherits"])
-
-        parent = self._definitions[inherits_from]["overrides"]
-        if key not in self._definitions[self.base_def]["overrides"]:
-            is_number = False
-        else:
-            is_number = self._definitions[self.base_def]["overrides"][key]["type"] in ("float", "int")
+                definition_file = definition_file.parent.joinpath(f"{parsed['inherits']}.def.json")
+
+    def _getOverrideChain(self, inherits_from):
+        """ Collects the overrides of inherits_from and each of its ancestors into a list, nearest ancestor first.
+
+        Ancestors without an overrides section are skipped. The result is cached so the inherits chain is only walked
+        once per parent, no matter how many override keys are checked against it.
+        """
+        chain = self._override_chain_cache.get(inherits_from)
+        if chain is None:
+            chain = []
+            definition_name = inherits_from
+            while definition_name in self._definitions:
+                definition = self._definitions[definition_name]
+                if "overrides" in definition:
+                    chain.append(definition["overrides"])
+                definition_name = definition.get("inherits")
+            self._override_chain_cache[inherits_from] = chain
+        return chain
+
+    def _collectParentComparisons(self, key, value_dict, inherits_from):
+        """ Collects the ordered comparisons of an override key against the nearest overriding parent.
+
+        Each comparison is a (child_key, child_value, normalized_value, check_value, is_float_pair) tuple;
+        is_float_pair marks comparisons where both sides are numbers, which can be compared in bulk.
+        """
+        chain = self._getOverrideChain(inherits_from)
+        if not chain or key not in chain[0]:
+            return []
+
+        parent = chain[0]
+        is_number = key in self._numeric_keys
+        comparisons = []
         for child_key, child_value in value_dict.items():
-            if key in parent:
-                if child_key in ("default_value", "value"):
-                    check_values = [cv for cv in [parent[key].get("default_value", None), parent[key].get("value", None)] if cv is not None]
+            if child_key in ("default_value", "value"):
+                if is_number:
+                    normalized_value = _normalizeNumber(child_value)
+                    check_values = self._getNormalizedParentValues(inherits_from, key, parent)
                 else:
-                    check_values = [parent[key].get(child_key, None)]
+                    normalized_value = child_value
+                    check_values = (parent[key].get("default_value", None), parent[key].get("value", None))
                 for check_value in check_values:
-                    if is_number and child_key in ("default_value", "value"):
-                        try:
-                            v = str(float(child_value))
-                        except:
-                            v = child_value
-                        try:
-                            cv = str(float(check_value))
-                        except:
-                            cv = check_value
-                    else:
-                        v = child_value
-                        cv = check_value
-                    if v == cv:
-                        return True, child_key, child_value, parent
-
-                if "inherits" in parent:
-                    return self._isDefinedInParent(key, value_dict, parent["inherits"])
-        return False, None, None, None
+                    if check_value is None:
+                        continue
+                    is_float_pair = is_number and _isFloat(normalized_value) and _isFloat(check_value)
+                    comparisons.append((child_key, child_value, normalized_value, check_value, is_float_pair))
+            else:
+                comparisons.append((child_key, child_value, child_value, parent[key].get(child_key, None), False))
+        return comparisons
+
+    def _getNormalizedParentValues(self, inherits_from, key, parent):
+        """ Returns the parent's (default_value, value) pair for key with numbers normalized, cached per parent. """
+        per_parent = self._parent_normalized.setdefault(inherits_from, {})
+        normalized = per_parent.get(key)
+        if normalized is None:
+            normalized = (_normalizeNumber(parent[key].get("default_value", None)),
+                          _normalizeNumber(parent[key].get("value", None)))
+            per_parent[key] = normalized
+        return normalized
 
     def _loadBasePrinterSettings(self):
         """ TODO @Jelle please explain why this """
@@ -124,9 +273,10 @@ class Definition(Linter):
         for k, v in self._definitions[self.base_def]["settings"].items():
             self._getSetting(k, v, settings)
         self._definitions[self.base_def] = {"overrides": settings}
+        self._numeric_keys = frozenset(key for key, setting in settings.items() if setting.get("type") in ("float", "int"))
 
     def _getSetting(self, name, setting, settings) -> None:
         if "children" in setting:
             for childname, child in setting["children"].items():
                 self._getSetting(childname, child, settings)
-        settings |= {name: setting}
+        settings[name] = setting
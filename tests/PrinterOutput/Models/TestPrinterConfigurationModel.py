@@ -6,6 +6,14 @@ import pytest
 
 from cura.PrinterOutput.Models.PrinterConfigurationModel import PrinterConfigurationModel
 from cura.PrinterOutput.Models.ExtruderConfigurationModel import ExtruderConfigurationModel
+from cura.PrinterOutput.Models.MaterialOutputModel import MaterialOutputModel
+
+
+def createModel(printer_type = "printer", extruder_positions = (0, 1)):
+    model = PrinterConfigurationModel()
+    model.setPrinterType(printer_type)
+    model.setExtruderConfigurations([ExtruderConfigurationModel(position) for position in extruder_positions])
+    return model
 
 test_validate_data_get_set = [
     {"attribute": "extruderConfigurations", "value": [ExtruderConfigurationModel()]},
@@ -43,3 +51,32 @@ def test_getAndSet(data):
     # The signal should not fire again
     if data.get("check_signal", True):
         assert signal.emit.call_count == 1
+
+
+def test_hashMatchesEquality():
+    # Models that compare equal must hash equal, even when the extruders were supplied in a different order.
+    model = createModel(extruder_positions = (0, 1))
+    reordered_model = createModel(extruder_positions = (1, 0))
+
+    assert model == reordered_model
+    assert hash(model) == hash(reordered_model)
+
+
+def test_hashChangesWithConfiguration():
+    model = createModel()
+
+    previous_hash = hash(model)
+    model.setPrinterType("other_printer")
+    assert hash(model) != previous_hash
+
+    previous_hash = hash(model)
+    model.setBuildplateConfiguration("glass")
+    assert hash(model) != previous_hash
+
+    previous_hash = hash(model)
+    model.setExtruderConfigurations([ExtruderConfigurationModel(0)])
+    assert hash(model) != previous_hash
+
+    previous_hash = hash(model)
+    model.extruderConfigurations[0].setMaterial(MaterialOutputModel(guid = "some_guid", type = "PLA", color = "blue", brand = "generic", name = "PLA"))
+    assert hash(model) != previous_hash